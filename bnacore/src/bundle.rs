@@ -7,7 +7,7 @@ use std::{
     ffi::OsStr,
     fs,
     fs::File,
-    io::{Read, Write},
+    io::{self, Read, Write},
     path::PathBuf,
 };
 use walkdir::{DirEntry, WalkDir};
@@ -224,13 +224,9 @@ impl Bundle {
 
             // Add each file from the group.
             for file in files {
-                // Read the input file.
+                // Stream the input file into the archive.
                 let mut f = File::open(file)?;
-                let mut buffer = Vec::new();
-                f.read_to_end(&mut buffer)?;
-
-                // Add the file object to the archive.
-                archive.write_all(&buffer)?;
+                io::copy(&mut f, &mut archive)?;
             }
             archive.finish().into_result()?;
         }
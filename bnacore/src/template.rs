@@ -89,19 +89,16 @@ pub fn render(
         let record: Record = result?;
 
         // Construct the name of the output file.
-        let item_name = match field_based_name.clone() {
+        let mut item = match &field_based_name {
             Some(fields) => {
                 let v = fields
-                    .clone()
                     .iter()
-                    .map(|f| record[f].clone())
-                    .map(|f| f.replace(' ', "_"))
+                    .map(|f| record[f].replace(' ', "_"))
                     .collect::<Vec<String>>();
                 v.join(sep).to_lowercase()
             }
-            None => record.values().next().unwrap().to_owned().to_lowercase(),
+            None => record.values().next().unwrap().to_lowercase(),
         };
-        let mut item = item_name.clone();
         item.push_str(".svg");
 
         // Render the template to file for this specific record.
@@ -97,6 +97,8 @@ async fn main() -> Result<(), Report> {
     // Prepare the downloader.
     let downloader = DownloaderBuilder::new()
         .directory(opts.destination_folder)
+        .concurrent_downloads(opts.parallel_requests.into())
+        .retries(opts.retries.into())
         .build();
 
     // Prepare the downloads for each city.